@@ -2,113 +2,293 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.collections import LineCollection
 import numpy as np
 import json
 import os
-from datetime import datetime
+import bisect
+import queue
+import threading
+import time
+from collections.abc import MutableMapping
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Weights applied to each parameter when scoring (column order used for bulk imports)
+PARAMETER_WEIGHTS = {
+    'preparedness': 0.2,
+    'teaching': 0.3,
+    'materials': 0.2,
+    'participation': 0.15,
+    'difficulty': -0.05  # Negative weight because higher difficulty lowers pass chance
+}
+WEIGHT_VECTOR = np.array(list(PARAMETER_WEIGHTS.values()), dtype=np.float64)
+PARAMETER_NAMES = tuple(PARAMETER_WEIGHTS)
+PARAMETER_INDEX = {name: i for i, name in enumerate(PARAMETER_NAMES)}
+
+def _build_scorer(weights):
+    """Generate a straight-line function computing the weighted sum of its arguments"""
+    args = ', '.join(weights)
+    expr = ' + '.join(f"{weight!r} * {name}" for name, weight in weights.items())
+    namespace = {}
+    exec(f"def _fast_score({args}):\n    return {expr}\n", namespace)
+    return namespace['_fast_score']
+
+# Unrolled scorer, e.g. _fast_score(p, t, m, c, d) -> 0.2*p + 0.3*t + ... + -0.05*d
+_fast_score = _build_scorer(PARAMETER_WEIGHTS)
+
+# Pass/fail bands: a score in [PASS_FAIL_THRESHOLDS[i-1], PASS_FAIL_THRESHOLDS[i])
+# maps to PASS_FAIL_RESULTS[i] as (prediction, text color, background color)
+PASS_FAIL_THRESHOLDS = (40, 50, 60, 70)
+PASS_FAIL_RESULTS = (
+    ("High fail chance", "red", "#ffdddd"),
+    ("Risk of failing", "orange", "#ffeeee"),
+    ("Borderline", "blue", "#ffffdd"),
+    ("Likely to pass", "darkgreen", "#eeffee"),
+    ("High pass chance", "green", "#ddffdd")
+)
+
+# CSV files above this size are read and scored in chunks of CSV_CHUNK_ROWS rows
+LARGE_CSV_BYTES = 100 * 1024 * 1024
+CSV_CHUNK_ROWS = 100_000
+
+# How often the UI checks for a finished bulk import (ms)
+IMPORT_POLL_MS = 50
+
+# Initial size of the preallocated performance history buffers
+HISTORY_CAPACITY = 1024
+
+# Plotting limits: markers are only drawn for short histories, and long
+# histories are decimated to at most MAX_PLOT_POINTS points
+MARKER_LIMIT = 200
+MAX_PLOT_POINTS = 2000
+
+def _bulk_scores_loop(arr, weights):
+    """Weighted score of every parameter row, clamped to 0-100
+    
+    Terms are added left to right, like _fast_score, so scores match it exactly.
+    """
+    n_rows, n_params = arr.shape
+    out = np.empty(n_rows)
+    for i in range(n_rows):
+        s = 0.0
+        for j in range(n_params):
+            s += arr[i, j] * weights[j]
+        out[i] = 0.0 if s < 0.0 else (100.0 if s > 100.0 else s)
+    return out
+
+if njit is not None:
+    # No fastmath: reassociating the sum could move scores across band edges
+    _bulk_scores = njit(cache=True)(_bulk_scores_loop)
+else:
+    # Without Numba the plain loop would be slow, so use NumPy instead. Columns
+    # are summed left to right, like _fast_score, so scores match it exactly
+    # (a BLAS matmul may sum in another order and flip scores on band edges)
+    def _bulk_scores(arr, weights):
+        total = arr[:, 0] * weights[0]
+        for j in range(1, arr.shape[1]):
+            total += arr[:, j] * weights[j]
+        return np.clip(total, 0, 100, out=total)
+
+def _decimate(x, y, max_points):
+    """Stride-decimate a line to at most max_points (+1) points, keeping the last one"""
+    n = len(y)
+    if n <= max_points:
+        return x, y
+    stride = -(-n // max_points)  # ceil division
+    if (n - 1) % stride:
+        return np.append(x[::stride], x[-1]), np.append(y[::stride], y[-1])
+    return x[::stride], y[::stride]
+
+# Last formatted timestamp, reused until the wall-clock second changes
+_last_sec = None
+_last_str = ''
+
+def _format_timestamp():
+    """Current local time as 'YYYY-mm-dd HH:MM:SS', formatted at most once per second"""
+    global _last_sec, _last_str
+    sec = int(time.time())
+    if sec != _last_sec:
+        _last_str = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(sec))
+        _last_sec = sec
+    return _last_str
+
+class ParameterVector(MutableMapping):
+    """Dict-style view over a parameter array stored in PARAMETER_NAMES order"""
+    def __init__(self, array):
+        self._array = array
+    
+    def __getitem__(self, name):
+        return int(self._array[PARAMETER_INDEX[name]])
+    
+    def __setitem__(self, name, value):
+        self._array[PARAMETER_INDEX[name]] = value
+    
+    def __delitem__(self, name):
+        raise TypeError("Parameters cannot be removed")
+    
+    def __iter__(self):
+        return iter(PARAMETER_NAMES)
+    
+    def __len__(self):
+        return len(PARAMETER_NAMES)
+    
+    def copy(self):
+        return dict(self)
 
 class SubjectPerformanceModel:
     def __init__(self):
-        self.confirmed_parameters = {
-            'preparedness': 50,        # Student preparedness for the subject
-            'teaching': 50,            # Teaching effectiveness
-            'materials': 50,           # Study materials availability
-            'participation': 50,       # Class participation
-            'difficulty': 50           # Subject difficulty (higher = harder)
-        }
-        self.pending_parameters = self.confirmed_parameters.copy()
-        self.performance_history = []
-        self.time_steps = []
-        self.current_time = 0
+        # Parameters are kept as arrays in PARAMETER_NAMES order:
+        #   preparedness   Student preparedness for the subject
+        #   teaching       Teaching effectiveness
+        #   materials      Study materials availability
+        #   participation  Class participation
+        #   difficulty     Subject difficulty (higher = harder)
+        self._confirmed = np.full(len(PARAMETER_NAMES), 50, dtype=np.int16)
+        self._pending = self._confirmed.copy()
+        self._clear_history()
         self.load_parameters()
         
+    @property
+    def confirmed_parameters(self):
+        """Confirmed parameters as a dict-style view"""
+        return ParameterVector(self._confirmed)
+    
+    @confirmed_parameters.setter
+    def confirmed_parameters(self, params):
+        self.confirmed_parameters.update(params)
+    
+    @property
+    def pending_parameters(self):
+        """Parameters set in the UI but not yet confirmed, as a dict-style view"""
+        return ParameterVector(self._pending)
+    
+    @pending_parameters.setter
+    def pending_parameters(self, params):
+        self.pending_parameters.update(params)
+    
+    @property
+    def performance_history(self):
+        """Recorded scores (a view into the history buffer)"""
+        return self._hist[:self._n]
+    
+    @property
+    def time_steps(self):
+        """Time step of each recorded score (a view into the history buffer)"""
+        return self._times[:self._n]
+    
+    def _clear_history(self, capacity=HISTORY_CAPACITY):
+        """Reset the preallocated score/time buffers"""
+        self._hist = np.empty(capacity, dtype=np.float64)
+        self._times = np.empty(capacity, dtype=np.int64)
+        self._n = 0
+        self.current_time = 0
+    
+    def _reserve(self, extra):
+        """Grow the history buffers (at least 2x) to fit `extra` more entries"""
+        needed = self._n + extra
+        if needed > len(self._hist):
+            capacity = max(needed, 2 * len(self._hist))
+            self._hist = np.resize(self._hist, capacity)
+            self._times = np.resize(self._times, capacity)
+    
+    def _extend_history(self, scores):
+        """Append already-clamped scores at consecutive time steps"""
+        count = len(scores)
+        self._reserve(count)
+        self._hist[self._n:self._n + count] = scores
+        self._times[self._n:self._n + count] = np.arange(self.current_time, self.current_time + count)
+        self._n += count
+        self.current_time += count
+    
     def load_parameters(self):
         """Load parameters from JSON file if it exists"""
-        if os.path.exists('subject_parameters.json'):
-            try:
-                with open('subject_parameters.json', 'r') as f:
-                    data = json.load(f)
-                    for param in self.confirmed_parameters:
-                        if param in data:
-                            self.confirmed_parameters[param] = data[param]
-                            self.pending_parameters[param] = data[param]
-            except Exception as e:
-                print(f"Error loading parameters: {e}")
+        try:
+            with open('subject_parameters.json', 'rb') as f:
+                raw = f.read()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            self.confirmed_parameters.update({k: data[k] for k in PARAMETER_NAMES if k in data})
+            self._pending[:] = self._confirmed
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Error loading parameters: {e}")
     
     def save_parameters(self):
         """Save current parameters to JSON file"""
         try:
-            with open('subject_parameters.json', 'w') as f:
-                json.dump(self.confirmed_parameters, f, indent=4)
+            if orjson is not None:
+                raw = orjson.dumps(dict(self.confirmed_parameters), option=orjson.OPT_INDENT_2)
+                with open('subject_parameters.json', 'wb') as f:
+                    f.write(raw)
+            else:
+                with open('subject_parameters.json', 'w') as f:
+                    json.dump(dict(self.confirmed_parameters), f, indent=4)
         except Exception as e:
             print(f"Error saving parameters: {e}")
     
     def update_pending_parameters(self, params):
         """Update parameters that haven't been confirmed yet"""
         for param, value in params.items():
-            if param in self.pending_parameters:
-                self.pending_parameters[param] = value
+            if param in PARAMETER_INDEX:
+                self._pending[PARAMETER_INDEX[param]] = value
     
     def confirm_parameters(self):
         """Confirm the pending parameters and recalculate"""
-        changes_made = False
-        change_log = []
-        
-        for param in self.confirmed_parameters:
-            if self.confirmed_parameters[param] != self.pending_parameters[param]:
-                old_val = self.confirmed_parameters[param]
-                new_val = self.pending_parameters[param]
-                change_log.append(f"{param.replace('_', ' ')}: {old_val} → {new_val}")
-                self.confirmed_parameters[param] = new_val
-                changes_made = True
-        
-        if changes_made:
+        changed = np.flatnonzero(self._confirmed != self._pending)
+        
+        if len(changed):
+            old_vals = self._confirmed[changed]
+            new_vals = self._pending[changed]
+            change_log = [
+                f"{PARAMETER_NAMES[i].replace('_', ' ')}: {old} → {new}"
+                for i, old, new in zip(changed, old_vals.tolist(), new_vals.tolist())
+            ]
+            self._confirmed[changed] = new_vals
+            
             self.save_parameters()
+            # Full recompute: a running sum drifts and can cross band thresholds
             self.calculate_performance()
             return "\n".join(change_log)
         return None
     
     def calculate_performance(self):
         """Calculate pass probability based on confirmed parameters"""
-        weights = {
-            'preparedness': 0.2,
-            'teaching': 0.3,
-            'materials': 0.2,
-            'participation': 0.15,
-            'difficulty': -0.05  # Negative weight because higher difficulty lowers pass chance
-        }
-        
         # Calculate weighted score (0-100 scale)
-        score = sum(self.confirmed_parameters[param] * weights[param] 
-                 for param in self.confirmed_parameters)
+        score = _fast_score(*self._confirmed.tolist())
         
+        return self._record_score(score)
+    
+    def _record_score(self, score):
+        """Clamp a score and append it to the performance history"""
         # Ensure score stays within bounds
         score = max(0, min(100, score))
         
         # Store the performance with timestamp
-        self.performance_history.append(score)
-        self.time_steps.append(self.current_time)
+        self._reserve(1)
+        self._hist[self._n] = score
+        self._times[self._n] = self.current_time
+        self._n += 1
         self.current_time += 1
         
         return score
     
     def predict_pass_fail(self):
         """Determine pass/fail prediction based on current score"""
-        if not self.performance_history:
+        if not self._n:
             return "No data", "black", "gray"
         
         current_score = self.performance_history[-1]
         
-        if current_score >= 70:
-            return "High pass chance", "green", "#ddffdd"
-        elif current_score >= 60:
-            return "Likely to pass", "darkgreen", "#eeffee"
-        elif current_score >= 50:
-            return "Borderline", "blue", "#ffffdd"
-        elif current_score >= 40:
-            return "Risk of failing", "orange", "#ffeeee"
-        else:
-            return "High fail chance", "red", "#ffdddd"
+        return PASS_FAIL_RESULTS[bisect.bisect_right(PASS_FAIL_THRESHOLDS, current_score)]
     
     def predict_trend(self):
         """Predict the performance trend based on recent data"""
@@ -116,13 +296,19 @@ class SubjectPerformanceModel:
             return "Not enough data", "black"
         
         # Use last 5 points for trend calculation
-        x = np.array(self.time_steps[-5:])
-        y = np.array(self.performance_history[-5:])
+        x = self.time_steps[-5:]
+        y = self.performance_history[-5:]
         
         if len(x) < 2:
             return "Not enough data", "black"
         
-        slope = np.polyfit(x, y, 1)[0]
+        # Closed-form least-squares slope (cheaper than np.polyfit for 5 points)
+        n = len(x)
+        sx = sum(x)
+        sy = sum(y)
+        sxy = sum(a * b for a, b in zip(x, y))
+        sx2 = sum(a * a for a in x)
+        slope = (n * sxy - sx * sy) / (n * sx2 - sx * sx)
         
         if slope > 1.5:
             return "Rapid improvement 📈", "green"
@@ -138,49 +324,105 @@ class SubjectPerformanceModel:
     def import_bulk_data(self, data_file):
         """Import bulk data from CSV/JSON file"""
         try:
-            # Clear existing data
-            self.performance_history = []
-            self.time_steps = []
-            self.current_time = 0
-            
-            if data_file.endswith('.csv'):
-                import pandas as pd
-                df = pd.read_csv(data_file)
-                # Convert all columns to numeric, filling missing with 50
-                for col in self.confirmed_parameters:
-                    if col in df.columns:
-                        df[col] = pd.to_numeric(df[col], errors='coerce').fillna(50)
-                    else:
-                        df[col] = 50  # Default value if column missing
-                
-                for _, row in df.iterrows():
-                    self.confirmed_parameters = {
-                        'preparedness': min(max(row.get('preparedness', 50), 0), 100),
-                        'teaching': min(max(row.get('teaching', 50), 0), 100),
-                        'materials': min(max(row.get('materials', 50), 0), 100),
-                        'participation': min(max(row.get('participation', 50), 0), 100),
-                        'difficulty': min(max(row.get('difficulty', 50), 0), 100)
-                    }
-                    self.calculate_performance()
-                    
-            elif data_file.endswith('.json'):
-                with open(data_file) as f:
-                    data = json.load(f)
-                    for entry in data:
-                        self.confirmed_parameters = {
-                            'preparedness': min(max(entry.get('preparedness', 50), 0), 100),
-                            'teaching': min(max(entry.get('teaching', 50), 0), 100),
-                            'materials': min(max(entry.get('materials', 50), 0), 100),
-                            'participation': min(max(entry.get('participation', 50), 0), 100),
-                            'difficulty': min(max(entry.get('difficulty', 50), 0), 100)
-                        }
-                        self.calculate_performance()
-            
-            self.save_parameters()
+            self.apply_bulk_scores(*self.read_bulk_data(data_file))
             return True, f"Successfully imported {len(self.performance_history)} records"
         
         except Exception as e:
             return False, f"Import failed: {str(e)}"
+    
+    def read_bulk_data(self, data_file):
+        """Parse and score a CSV/JSON file without changing the model state
+        
+        Returns the score of every row and the parameters of the last row
+        (None if the file has no rows), ready for apply_bulk_scores.
+        """
+        if data_file.endswith('.csv'):
+            if os.path.getsize(data_file) > LARGE_CSV_BYTES:
+                return self._score_csv_chunks(data_file)
+            return self._score_dataframe(self._read_csv(data_file))
+        elif data_file.endswith('.json'):
+            return self._score_dataframe(self._read_json(data_file))
+        return np.empty(0), None
+    
+    def apply_bulk_scores(self, scores, last_params):
+        """Replace the performance history with imported scores"""
+        # Clear existing data
+        self._clear_history()
+        self._extend_history(scores)
+        
+        if last_params is not None:
+            self.confirmed_parameters = last_params
+        
+        self.save_parameters()
+    
+    def _csv_usecols(self, data_file):
+        """Known parameter columns in a CSV header, or None to read every column"""
+        import pandas as pd
+        
+        # pyarrow needs an explicit column list, so read the header first. If no
+        # known column is present, read everything so the row count is kept and
+        # every row is scored with the default values.
+        header = pd.read_csv(data_file, nrows=0).columns
+        return [c for c in header if c in PARAMETER_WEIGHTS] or None
+    
+    def _read_csv(self, data_file):
+        """Read only the known parameter columns, preferring the pyarrow parser"""
+        import pandas as pd
+        usecols = self._csv_usecols(data_file)
+        
+        try:
+            return pd.read_csv(data_file, engine='pyarrow', usecols=usecols,
+                               dtype_backend='numpy_nullable')
+        except Exception:
+            # pyarrow missing or unable to parse this file
+            return pd.read_csv(data_file, engine='c', usecols=usecols,
+                               low_memory=False, cache_dates=False)
+    
+    def _score_csv_chunks(self, data_file):
+        """Score a large CSV chunk by chunk, keeping only the score vectors
+        
+        Only one chunk's DataFrame is alive at a time, so peak memory stays
+        bounded. pyarrow cannot read in chunks, so this uses the C parser.
+        """
+        import pandas as pd
+        chunks = pd.read_csv(data_file, engine='c', usecols=self._csv_usecols(data_file),
+                             cache_dates=False, chunksize=CSV_CHUNK_ROWS)
+        
+        scores = []
+        last_params = None
+        for chunk in chunks:
+            chunk_scores, chunk_last_params = self._score_dataframe(chunk)
+            scores.append(chunk_scores)
+            if chunk_last_params is not None:
+                last_params = chunk_last_params
+        
+        return (np.concatenate(scores) if scores else np.empty(0)), last_params
+    
+    def _read_json(self, data_file):
+        """Read a JSON list of parameter records straight into a DataFrame"""
+        import pandas as pd
+        if orjson is not None:
+            with open(data_file, 'rb') as f:
+                return pd.DataFrame(orjson.loads(f.read()))
+        return pd.read_json(data_file)
+    
+    def _score_dataframe(self, df):
+        """Score every row of an imported DataFrame with vectorized column sums"""
+        import pandas as pd
+        
+        # Missing columns and non-numeric cells default to 50, then the whole
+        # matrix is clamped to 0-100 in place
+        df = df.reindex(columns=list(PARAMETER_NAMES), fill_value=50)
+        arr = df.apply(pd.to_numeric, errors='coerce').fillna(50).to_numpy(dtype=np.float64, copy=True)
+        np.clip(arr, 0, 100, out=arr)
+        
+        scores = _bulk_scores(arr, WEIGHT_VECTOR)
+        
+        if not len(arr):
+            return scores, None
+        # Parameters are stored as integers, like the slider values
+        last_row = np.rint(arr[-1]).astype(np.int16)
+        return scores, dict(zip(PARAMETER_NAMES, last_row.tolist()))
 
 class SubjectEvaluationApp:
     def __init__(self, root):
@@ -222,27 +464,32 @@ class SubjectEvaluationApp:
         self.sliders = {}
         self.slider_vars = {}
         self.value_labels = {}
+        self._pending_slider = {}
+        self._slider_job = None
+        self._snapping_sliders = False
         
         for i, param in enumerate(self.model.confirmed_parameters):
             # Parameter label
             label = ttk.Label(control_frame, text=f"{param_labels[param]}:", anchor=tk.W)
             label.grid(row=i, column=0, sticky=tk.W, padx=(0, 5), pady=2)
             
-            # Slider
-            self.slider_vars[param] = tk.IntVar(value=self.model.pending_parameters[param])
+            # Slider (every change to its variable, whether from mouse or keyboard,
+            # goes through the variable trace below)
+            var = tk.IntVar(value=self.model.pending_parameters[param])
+            self.slider_vars[param] = var
             slider = ttk.Scale(
                 control_frame,
                 from_=0,
                 to=100,
-                variable=self.slider_vars[param],
-                command=lambda v, p=param: self.slider_changed(p, v)
+                variable=var
             )
             slider.grid(row=i, column=1, sticky=tk.EW, padx=5, pady=2)
             self.sliders[param] = slider
             
-            # Value label with fixed width
-            self.value_labels[param] = ttk.Label(control_frame, text="50", width=3, anchor=tk.E)
+            # Value label with fixed width, kept in sync with the slider variable
+            self.value_labels[param] = ttk.Label(control_frame, text=str(var.get()), width=3, anchor=tk.E)
             self.value_labels[param].grid(row=i, column=2, sticky=tk.E, padx=(0, 5), pady=2)
+            var.trace_add('write', lambda *a, p=param: self.slider_var_written(p))
         
         # Confirm button
         self.confirm_btn = ttk.Button(
@@ -312,23 +559,71 @@ class SubjectEvaluationApp:
         self.ax.grid(True, linestyle='--', alpha=0.7)
         self.line, = self.ax.plot([], [], 'b-', linewidth=2, marker='o', markersize=5)
         
-        # Add threshold lines
-        self.ax.axhline(y=70, color='green', linestyle='--', alpha=0.3)
-        self.ax.axhline(y=60, color='darkgreen', linestyle='--', alpha=0.3)
-        self.ax.axhline(y=50, color='blue', linestyle='--', alpha=0.3)
-        self.ax.axhline(y=40, color='orange', linestyle='--', alpha=0.3)
+        # Add threshold lines as one artist; x spans the axes whatever the xlim
+        thresholds = LineCollection(
+            [[(0, y), (1, y)] for y in (70, 60, 50, 40)],
+            colors=['green', 'darkgreen', 'blue', 'orange'],
+            linestyles='--',
+            alpha=0.3,
+            transform=self.ax.get_yaxis_transform()
+        )
+        self.ax.add_collection(thresholds, autolim=False)
         
         self.canvas = FigureCanvasTkAgg(self.figure, master=graph_frame)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        
+        # Blitting: only the data line is redrawn on top of a cached background
+        self.line.set_animated(True)
+        self._redraw_job = None
+        self.full_redraw()
+        self.canvas.get_tk_widget().bind('<Configure>', self.schedule_full_redraw, add='+')
+    
+    def schedule_full_redraw(self, event=None):
+        """Queue at most one full redraw (e.g. while the window is being resized)"""
+        if self._redraw_job is None:
+            self._redraw_job = self.root.after_idle(self.full_redraw)
+    
+    def full_redraw(self):
+        """Redraw the whole figure and re-cache the static background"""
+        self._redraw_job = None
+        self.canvas.draw()
+        self._bg = self.canvas.copy_from_bbox(self.ax.bbox)
+        self.blit_line()
+    
+    def blit_line(self):
+        """Draw only the data line over the cached background"""
+        self.canvas.restore_region(self._bg)
+        self.ax.draw_artist(self.line)
+        self.canvas.blit(self.ax.bbox)
+    
+    def slider_var_written(self, param):
+        """Sync the value label and queue a (debounced) pending-parameter update"""
+        value = self.slider_vars[param].get()
+        self.value_labels[param].configure(text=str(value))
+        if not self._snapping_sliders:
+            self.slider_changed(param, value)
     
     def slider_changed(self, param, value):
-        """Handle slider changes (updates pending parameters)"""
-        int_value = int(float(value))
-        self.slider_vars[param].set(int_value)
-        self.value_labels[param].config(text=str(int_value))
+        """Handle slider changes (coalesced to one UI update per idle cycle)"""
+        self._pending_slider[param] = int(float(value))
+        if self._slider_job is None:
+            self._slider_job = self.root.after_idle(self._flush_slider)
+    
+    def _flush_slider(self):
+        """Apply the latest slider positions (updates pending parameters)"""
+        self._slider_job = None
+        updates, self._pending_slider = self._pending_slider, {}
+        
+        # Snap the sliders to whole numbers without re-queueing another flush
+        self._snapping_sliders = True
+        try:
+            for param, int_value in updates.items():
+                self.slider_vars[param].set(int_value)
+        finally:
+            self._snapping_sliders = False
         
         # Update pending parameters
-        self.model.update_pending_parameters({param: int_value})
+        self.model.update_pending_parameters(updates)
         
         # Show pending changes
         pending_changes = []
@@ -384,27 +679,28 @@ class SubjectEvaluationApp:
         
         # Show loading message
         self.import_status.config(text="Importing data...", foreground="blue")
-        self.root.update()
         
-        # Process in background
-        self.root.after(100, lambda: self.process_import(filename))
+        # Parse and score on a worker thread so the UI stays responsive
+        self._import_q = queue.Queue()
+        threading.Thread(target=self._do_import, args=(filename,), daemon=True).start()
+        self.root.after(IMPORT_POLL_MS, self._poll_import)
 
     def set_widgets_state(self, state):
-        """Safely set state for widgets that support it"""
-        widgets_to_disable = [
+        """Set state for all input widgets in a single Tcl call"""
+        widgets = [
             *self.sliders.values(),
             self.confirm_btn,
             self.browse_btn,
             self.import_btn
         ]
         
-        for widget in widgets_to_disable:
-            try:
-                widget.configure(state=state)
-            except:
-                pass  # Skip widgets that don't support state
+        # All of these are ttk widgets, so the ttk `state` command applies to each
+        flag = 'disabled' if state == 'disabled' else '!disabled'
+        paths = ' '.join(str(widget) for widget in widgets)
+        self.root.tk.eval(f"foreach w {{{paths}}} {{$w state {flag}}}")
 
-    def process_import(self, filename):
+    def _do_import(self, filename):
+        """Validate, parse and score an import file (runs on a worker thread)"""
         try:
             # Verify file exists
             if not os.path.exists(filename):
@@ -413,18 +709,36 @@ class SubjectEvaluationApp:
             # Verify file extension
             if not (filename.endswith('.csv') or filename.endswith('.json')):
                 raise ValueError("Invalid file type. Please use .csv or .json")
-                
-            success, message = self.model.import_bulk_data(filename)
+        except Exception as e:
+            self._import_q.put(('error', str(e)))
+            return
+        
+        try:
+            scores, last_params = self.model.read_bulk_data(filename)
+        except Exception as e:
+            self._import_q.put(('error', f"Import failed: {str(e)}"))
+            return
+        
+        self._import_q.put(('done', scores, last_params))
+    
+    def _poll_import(self):
+        """Apply the worker's import result once it is available"""
+        try:
+            result = self._import_q.get_nowait()
+        except queue.Empty:
+            self.root.after(IMPORT_POLL_MS, self._poll_import)
+            return
+        
+        try:
+            if result[0] == 'error':
+                raise Exception(result[1])
             
-            if success:
-                self.import_status.config(text=message, foreground="green")
-                # Force full display update
-                self.update_display()
-                # Explicitly redraw canvas
-                self.canvas.draw()
-                messagebox.showinfo("Success", message)
-            else:
-                raise Exception(message)
+            self.model.apply_bulk_scores(*result[1:])
+            message = f"Successfully imported {len(self.model.performance_history)} records"
+            self.import_status.config(text=message, foreground="green")
+            # Force full display update
+            self.update_display()
+            messagebox.showinfo("Success", message)
                 
         except Exception as e:
             self.import_status.config(text=str(e), foreground="red")
@@ -436,7 +750,7 @@ class SubjectEvaluationApp:
     def update_display(self):
         """Update all displays with current model data"""
         # Update score and prediction
-        if self.model.performance_history:
+        if len(self.model.performance_history):
             current_score = self.model.performance_history[-1]
             prediction, text_color, bg_color = self.model.predict_pass_fail()
             trend, trend_color = self.model.predict_trend()
@@ -455,7 +769,7 @@ class SubjectEvaluationApp:
                 foreground=trend_color
             )
             self.last_update_label.config(
-                text=f"Last update: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+                text=f"Last update: {_format_timestamp()}"
             )
         else:
             self.current_score_label.config(text="Pass Probability: -")
@@ -464,11 +778,17 @@ class SubjectEvaluationApp:
             self.last_update_label.config(text="Last update: Never")
         
         # Update graph
-        if self.model.time_steps and self.model.performance_history:
-            self.line.set_data(self.model.time_steps, self.model.performance_history)
-            self.ax.set_xlim(0, max(self.model.time_steps) + 1 if len(self.model.time_steps) > 1 else 2)
-            self.ax.set_ylim(0, 100)
-            self.canvas.draw()
+        if len(self.model.time_steps):
+            history = self.model.performance_history
+            self.line.set_marker('o' if len(history) <= MARKER_LIMIT else 'None')
+            self.line.set_data(*_decimate(self.model.time_steps, history, MAX_PLOT_POINTS))
+            xlim = (0, self.model.time_steps[-1] + 1 if len(self.model.time_steps) > 1 else 2)
+            if self.ax.get_xlim() != xlim:
+                # Axis ticks change, so the cached background is stale
+                self.ax.set_xlim(*xlim)
+                self.full_redraw()
+            else:
+                self.blit_line()
     
     def on_closing(self):
         """Handle window closing"""
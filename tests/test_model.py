@@ -0,0 +1,157 @@
+import json
+
+import pytest
+
+from main import SubjectPerformanceModel
+
+
+@pytest.fixture
+def model(tmp_path, monkeypatch):
+    # The model reads and writes subject_parameters.json in the working directory
+    monkeypatch.chdir(tmp_path)
+    return SubjectPerformanceModel()
+
+
+def test_import_integer_csv(model, tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text(
+        "preparedness,teaching,materials,participation,difficulty\n"
+        "50,50,50,50,50\n"
+        "100,100,100,100,0\n"
+    )
+
+    success, message = model.import_bulk_data(str(path))
+
+    assert success, message
+    assert model.performance_history.tolist() == pytest.approx([40.0, 85.0])
+    assert dict(model.confirmed_parameters) == {
+        'preparedness': 100, 'teaching': 100, 'materials': 100,
+        'participation': 100, 'difficulty': 0
+    }
+
+
+def test_import_integer_json(model, tmp_path):
+    path = tmp_path / "data.json"
+    path.write_text(json.dumps([
+        {'preparedness': 50, 'teaching': 50, 'materials': 50, 'participation': 50, 'difficulty': 50},
+        {'preparedness': 100, 'teaching': 100, 'materials': 100, 'participation': 100, 'difficulty': 0},
+    ]))
+
+    success, message = model.import_bulk_data(str(path))
+
+    assert success, message
+    assert model.performance_history.tolist() == pytest.approx([40.0, 85.0])
+
+
+def test_import_csv_without_known_columns_keeps_rows(model, tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("a,b\n1,2\n3,4\n5,6\n")
+
+    success, message = model.import_bulk_data(str(path))
+
+    assert success, message
+    # Missing parameters default to 50, giving a score of 40 for every row
+    assert model.performance_history.tolist() == pytest.approx([40.0, 40.0, 40.0])
+
+
+def test_read_csv_uses_pyarrow_engine(model, tmp_path, monkeypatch):
+    pytest.importorskip("pyarrow")
+    import pandas as pd
+
+    path = tmp_path / "data.csv"
+    path.write_text("teaching,extra\n60,1\n")
+
+    engines = []
+    read_csv = pd.read_csv
+
+    def recording_read_csv(*args, **kwargs):
+        engines.append(kwargs.get('engine'))
+        return read_csv(*args, **kwargs)
+
+    monkeypatch.setattr(pd, "read_csv", recording_read_csv)
+    df = model._read_csv(str(path))
+
+    assert engines[-1] == 'pyarrow'
+    assert list(df.columns) == ['teaching']
+
+
+def test_confirm_scores_match_full_recompute(model):
+    model.calculate_performance()
+    for params in ([97, 57, 60, 83, 48], [100, 26, 12, 62, 3], [49, 55, 77, 97, 98],
+                   [77, 63, 50, 43, 15]):
+        model.update_pending_parameters(dict(zip(model.confirmed_parameters, params)))
+        model.confirm_parameters()
+
+    # 0.2*77 + 0.3*63 + 0.2*50 + 0.15*43 - 0.05*15 is exactly on the 50 threshold
+    assert model.performance_history[-1] == 50.0
+    assert model.predict_pass_fail()[0] == "Borderline"
+
+
+def test_parameter_vector_behaves_like_dict(model):
+    expected = {'preparedness': 10, 'teaching': 20, 'materials': 30,
+                'participation': 40, 'difficulty': 50}
+    model.confirmed_parameters = expected
+    params = model.confirmed_parameters
+
+    assert dict(params) == expected
+    assert list(params.items()) == list(expected.items())
+    assert list(params.values()) == list(expected.values())
+    assert params == expected
+
+
+def test_bulk_score_matches_single_row_score_on_threshold(model, tmp_path):
+    from main import _fast_score
+
+    # Summed left to right this row scores just below 40
+    row = [35, 51, 29, 99, 59]
+    path = tmp_path / "data.csv"
+    path.write_text(
+        "preparedness,teaching,materials,participation,difficulty\n"
+        + ",".join(map(str, row)) + "\n"
+    )
+
+    success, message = model.import_bulk_data(str(path))
+
+    assert success, message
+    assert model.performance_history[-1] == _fast_score(*row)
+    assert model.predict_pass_fail()[0] == "High fail chance"
+
+
+def test_bulk_scores_loop_matches_single_row_score():
+    import numpy as np
+    from main import WEIGHT_VECTOR, _bulk_scores_loop, _fast_score
+
+    rows = [[35, 51, 29, 99, 59], [77, 63, 50, 43, 15], [0, 0, 0, 0, 100], [100, 100, 100, 100, 0]]
+    scores = _bulk_scores_loop(np.array(rows, dtype=np.float64), WEIGHT_VECTOR)
+
+    assert scores.tolist() == [max(0.0, min(100.0, _fast_score(*row))) for row in rows]
+
+
+def test_import_large_csv_in_chunks(model, tmp_path, monkeypatch):
+    import main
+
+    path = tmp_path / "data.csv"
+    path.write_text(
+        "preparedness,teaching,materials,participation,difficulty\n"
+        "50,50,50,50,50\n"
+        "100,100,100,100,0\n"
+        "0,0,0,0,100\n"
+        "35,51,29,99,59\n"
+        "77,63,50,43,15\n"
+    )
+    success, message = model.import_bulk_data(str(path))
+    assert success, message
+    expected = model.performance_history.tolist()
+
+    # Force the chunked path, two rows per chunk
+    monkeypatch.setattr(main, "LARGE_CSV_BYTES", 0)
+    monkeypatch.setattr(main, "CSV_CHUNK_ROWS", 2)
+    monkeypatch.setattr(model, "_read_csv", None)
+    success, message = model.import_bulk_data(str(path))
+
+    assert success, message
+    assert model.performance_history.tolist() == expected
+    assert dict(model.confirmed_parameters) == {
+        'preparedness': 77, 'teaching': 63, 'materials': 50,
+        'participation': 43, 'difficulty': 15
+    }